@@ -5,22 +5,24 @@ Copyright (c) 2024-2026 Mesh Logic Pty Ltd
 Licensed under the Apache License, Version 2.0
 """
 
+from .async_client import AsyncMeshLogicClient
+from .cache import Cache, MemoryCache
 from .client import MeshLogicClient
 from .exceptions import (
-    MeshLogicError,
     AuthenticationError,
-    RateLimitError,
+    MeshLogicError,
     NotFoundError,
+    RateLimitError,
     ValidationError,
 )
 from .types import (
+    Device,
     Event,
-    ProcessEvent,
     FileEvent,
     NetworkEvent,
-    Device,
     Pattern,
     PatternMatch,
+    ProcessEvent,
 )
 
 __version__ = "0.1.0"
@@ -30,6 +32,10 @@ __email__ = "support@meshlogic.ai"
 __all__ = [
     # Client
     "MeshLogicClient",
+    "AsyncMeshLogicClient",
+    # Caching
+    "Cache",
+    "MemoryCache",
     # Exceptions
     "MeshLogicError",
     "AuthenticationError",
@@ -0,0 +1,244 @@
+"""
+MeshLogic asynchronous API Client.
+
+Copyright (c) 2024-2026 Mesh Logic Pty Ltd
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Iterable, Optional
+
+import httpx
+
+from .cache import Cache, CacheEntry, cache_key, cache_namespace
+from .client import (
+    _DEFAULT_ENDPOINT,
+    DEFAULT_LIMITS,
+    DEFAULT_REGION,
+    ENDPOINTS,
+    RETRY_ON_STATUS,
+    _can_retry,
+    _decode_json,
+    _default_headers,
+    _encode_json,
+    _raise_for_status,
+    _request_headers,
+    _retry_delay,
+)
+from .exceptions import AuthenticationError
+from .resources import AsyncDevicesResource, AsyncEventsResource, AsyncPatternsResource
+
+
+class AsyncMeshLogicClient:
+    """
+    Asynchronous MeshLogic API client.
+
+    Resource methods are coroutines, so independent requests can be issued
+    concurrently with ``asyncio.gather`` instead of paying one round trip each.
+
+    Example:
+        >>> async with AsyncMeshLogicClient(api_key="your-api-key") as client:
+        ...     events = await asyncio.gather(*(client.events.get(i) for i in ids))
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        region: str = DEFAULT_REGION,
+        base_url: Optional[str] = None,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        http2: bool = True,
+        retry_on_status: Iterable[int] = RETRY_ON_STATUS,
+        cache: Optional[Cache] = None,
+        catalog_ttl: float = 60.0,
+        device_cache_ttl: float = 0.0,
+        concurrency_limit: int = 20,
+    ):
+        """
+        Initialize the asynchronous MeshLogic client.
+
+        Args:
+            api_key: API key for authentication. If not provided, reads from
+                     MESHLOGIC_API_KEY environment variable.
+            region: AWS region for the API endpoint. Default: ap-southeast-2
+            base_url: Override the API base URL. Optional.
+            timeout: Request timeout in seconds. Default: 30.0
+            max_retries: Maximum number of retry attempts. Default: 3
+            http2: Negotiate HTTP/2 so concurrent calls share one connection.
+                   Default: True
+            retry_on_status: Response statuses that are retried with backoff.
+                             Default: 429, 502, 503, 504
+            cache: Cache for GET responses, revalidated with ETag /
+                   Last-Modified. Default: None (no caching)
+            catalog_ttl: Seconds to reuse pattern listings before fetching
+                         them again; 0 disables. Default: 60.0
+            device_cache_ttl: Seconds to reuse device lookups. Cached devices
+                              can report a stale status and last_seen, so
+                              this is off by default. Default: 0.0
+            concurrency_limit: Maximum number of requests in flight at once.
+                               Size it to roughly the rate-limit bucket divided
+                               by the bucket window in seconds so fan-out stays
+                               under the limit instead of retrying. Default: 20
+
+        Raises:
+            AuthenticationError: If no API key is provided or found.
+            ValueError: If ``concurrency_limit`` is less than 1.
+        """
+        if concurrency_limit < 1:
+            raise ValueError("concurrency_limit must be at least 1")
+
+        self._api_key = api_key or os.environ.get("MESHLOGIC_API_KEY")
+        if not self._api_key:
+            raise AuthenticationError(
+                "API key required. Provide via api_key parameter or "
+                "MESHLOGIC_API_KEY environment variable."
+            )
+
+        self._region = region
+        self._base_url = base_url or ENDPOINTS.get(region, _DEFAULT_ENDPOINT)
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._retry_on_status = frozenset(retry_on_status)
+        self._cache = cache
+        self._cache_namespace = cache_namespace(self._base_url, self._api_key)
+        self._catalog_ttl = catalog_ttl
+        self._device_cache_ttl = device_cache_ttl
+        self._concurrency_limit = concurrency_limit
+        # Created on first request so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # Initialize HTTP client
+        self._http = httpx.AsyncClient(
+            base_url=self._base_url,
+            headers=_default_headers(self._api_key),
+            timeout=timeout,
+            http2=http2,
+            limits=DEFAULT_LIMITS,
+        )
+
+        # Initialize resource handlers
+        self.events = AsyncEventsResource(self)
+        self.devices = AsyncDevicesResource(self)
+        self.patterns = AsyncPatternsResource(self)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        json: Optional[dict] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> dict:
+        """
+        Make an API request and decode the JSON response.
+
+        Accepts the same arguments as ``_request_raw``.
+
+        Returns:
+            Response JSON as dictionary
+        """
+        content = await self._request_raw(
+            method,
+            path,
+            params=params,
+            json=json,
+            idempotency_key=idempotency_key,
+        )
+        return _decode_json(content)
+
+    async def _request_raw(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        json: Optional[dict] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> bytes:
+        """
+        Make an API request and return the undecoded response body.
+
+        Used by resources that decode responses straight into typed objects.
+
+        At most ``concurrency_limit`` requests are sent at once; the slot is
+        released while waiting to retry. Retryable failures are re-sent up
+        to ``max_retries`` times. Requests with non-idempotent methods are
+        only retried when an idempotency key is given. When the client has a
+        cache, GET responses are served from it while fresh and revalidated
+        with a conditional request once stale.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path
+            params: Query parameters
+            json: JSON body
+            idempotency_key: Sent as the Idempotency-Key header. Optional.
+
+        Returns:
+            Response body as bytes
+
+        Raises:
+            MeshLogicError: On API error
+            RateLimitError: When rate limited
+            NotFoundError: When resource not found
+        """
+        headers = _request_headers(idempotency_key)
+        retryable = _can_retry(method, idempotency_key)
+        content = _encode_json(json)
+
+        cache = self._cache if method.upper() == "GET" else None
+        entry: Optional[CacheEntry] = None
+        if cache is not None:
+            key = cache_key(self._cache_namespace, path, params)
+            entry = cache.get(key)
+            if entry is not None:
+                if entry.is_fresh():
+                    return entry.content
+                headers = {**(headers or {}), **entry.validators()}
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency_limit)
+
+        for attempt in range(self._max_retries + 1):
+            async with self._semaphore:
+                response = await self._http.request(
+                    method=method,
+                    url=path,
+                    params=params,
+                    content=content,
+                    headers=headers,
+                )
+            if (
+                not retryable
+                or attempt == self._max_retries
+                or response.status_code not in self._retry_on_status
+            ):
+                break
+            delay = _retry_delay(response, attempt)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        if cache is not None and entry is not None and response.status_code == 304:
+            cache.set(key, entry.revalidated(response))
+            return entry.content
+
+        _raise_for_status(response, path)
+        if cache is not None:
+            fresh_entry = CacheEntry.from_response(response)
+            if fresh_entry is not None:
+                cache.set(key, fresh_entry)
+        return response.content
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> AsyncMeshLogicClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
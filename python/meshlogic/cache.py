@@ -0,0 +1,198 @@
+"""
+MeshLogic SDK response caching.
+
+Copyright (c) 2024-2026 Mesh Logic Pty Ltd
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Protocol, Tuple
+
+import httpx
+from cachetools import LRUCache, TTLCache
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, object], ...]]
+
+
+@dataclass
+class CacheEntry:
+    """A cached GET response body and its HTTP validators."""
+
+    content: bytes
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> Optional[CacheEntry]:
+        """
+        Build an entry from a successful response.
+
+        Returns None when the response must not be cached, either because the
+        server sent ``no-store`` or because it can neither be served fresh nor
+        revalidated later.
+        """
+        ttl = _max_age(response.headers.get("Cache-Control", ""))
+        if ttl is None:
+            return None
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if ttl <= 0 and not (etag or last_modified):
+            return None
+
+        return cls(
+            content=response.content,
+            expires_at=time.monotonic() + ttl,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def is_fresh(self) -> bool:
+        """Whether the entry can be served without contacting the API."""
+        return time.monotonic() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating the entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def revalidated(self, response: httpx.Response) -> CacheEntry:
+        """Return a copy refreshed by a 304 Not Modified response."""
+        ttl = _max_age(response.headers.get("Cache-Control", "")) or 0.0
+        return CacheEntry(
+            content=self.content,
+            expires_at=time.monotonic() + ttl,
+            etag=response.headers.get("ETag", self.etag),
+            last_modified=response.headers.get("Last-Modified", self.last_modified),
+        )
+
+
+class Cache(Protocol):
+    """Storage backend for cached GET responses."""
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """Return the entry stored under ``key``, if any."""
+        ...
+
+    def set(self, key: Hashable, entry: CacheEntry) -> None:
+        """Store ``entry`` under ``key``."""
+        ...
+
+
+class MemoryCache:
+    """
+    In-process response cache.
+
+    Entries are kept past their freshness lifetime so they can be revalidated
+    with If-None-Match; the least recently used entries are evicted once
+    ``maxsize`` is reached.
+
+    Example:
+        >>> client = MeshLogicClient(api_key="your-api-key", cache=MemoryCache())
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of responses to keep. Default: 256
+        """
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: Hashable, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+class _ResultCache:
+    """
+    Short-lived cache of decoded results for rarely changing resources.
+
+    Used for the pattern and device catalogs so that frequent polling is
+    served locally for ``ttl`` seconds. A ``ttl`` of 0 disables caching.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self._entries: Optional[TTLCache] = TTLCache(maxsize=maxsize, ttl=ttl) if ttl > 0 else None
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        if self._entries is None:
+            return None
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self._entries is None:
+            return
+        with self._lock:
+            self._entries[key] = value
+
+    def clear(self) -> None:
+        if self._entries is None:
+            return
+        with self._lock:
+            self._entries.clear()
+
+
+def cache_namespace(base_url: str, api_key: str) -> str:
+    """
+    Identify the API endpoint and credential a client's cache entries belong to.
+
+    The API key is hashed so it is never stored in the cache itself.
+    """
+    digest = hashlib.sha256(api_key.encode()).hexdigest()
+    return f"{base_url}#{digest}"
+
+
+def cache_key(namespace: str, path: str, params: Optional[dict] = None) -> CacheKey:
+    """
+    Build the cache key for a GET request.
+
+    Keys are scoped by ``namespace`` so that clients for different accounts
+    or endpoints can safely share one cache.
+    """
+    return (namespace, path, tuple(sorted((params or {}).items())))
+
+
+def _max_age(cache_control: str) -> Optional[float]:
+    """
+    Parse the freshness lifetime from a Cache-Control header.
+
+    Returns None for ``no-store``, 0 when the response must be revalidated
+    before reuse, and the ``max-age`` in seconds otherwise.
+    """
+    directives = {}
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    try:
+        return max(float(directives.get("max-age", 0)), 0.0)
+    except ValueError:
+        return 0.0
@@ -7,21 +7,28 @@ Licensed under the Apache License, Version 2.0
 
 from __future__ import annotations
 
+import math
 import os
-from typing import Iterator, Optional
+import random
+import threading
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 
 import httpx
+import msgspec
 
+from .cache import Cache, CacheEntry, cache_key, cache_namespace
 from .exceptions import (
-    MeshLogicError,
     AuthenticationError,
-    RateLimitError,
+    MeshLogicError,
     NotFoundError,
+    RateLimitError,
 )
-from .types import Event, Device, Pattern, PatternMatch
-from .resources import EventsResource, DevicesResource, PatternsResource
-
+from .resources import DevicesResource, EventsResource, PatternsResource
+from .types import Device, Event, Pattern, PatternMatch
 
 # Default API endpoints by region
 ENDPOINTS = {
@@ -30,13 +37,192 @@ ENDPOINTS = {
     "eu-west-1": "https://api.eu.meshlogic.ai",
 }
 
+# Endpoint used when the region is not recognised
+DEFAULT_REGION = "ap-southeast-2"
+_DEFAULT_ENDPOINT = ENDPOINTS[DEFAULT_REGION]
+
+# Connection pool sizing shared by the sync and async clients
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+
+# Response statuses retried by default
+RETRY_ON_STATUS = frozenset({429, 502, 503, 504})
+
+# Methods that are safe to retry without an idempotency key
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Retry timing, in seconds
+_BACKOFF_BASE = 0.5
+_BACKOFF_JITTER = 0.25
+_MAX_RETRY_DELAY = 10.0
+
+# Wait reported in RateLimitError when a 429 carries no usable Retry-After
+_DEFAULT_RETRY_AFTER = 60.0
+
+
+def _request_headers(idempotency_key: Optional[str]) -> Optional[dict]:
+    """Build per-request headers layered over the client defaults."""
+    if idempotency_key:
+        return {"Idempotency-Key": idempotency_key}
+    return None
+
+
+def _can_retry(method: str, idempotency_key: Optional[str]) -> bool:
+    """Whether a failed request may be safely re-sent."""
+    return method.upper() in _IDEMPOTENT_METHODS or bool(idempotency_key)
+
+
+def _parse_retry_after(value: Optional[str], now: float) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds to wait.
+
+    Accepts both forms allowed by RFC 7231: a number of seconds or an
+    HTTP-date. Returns None when the header is missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(int(value)), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - now, 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """
+    Compute how long to wait before retrying a failed request.
+
+    Rate-limited responses honour the server's Retry-After; other retryable
+    statuses, and 429s without a usable Retry-After, back off exponentially,
+    capped at ``_MAX_RETRY_DELAY``. Delays are jittered so that concurrent
+    clients do not retry in lockstep.
+
+    Returns:
+        Seconds to wait, or None when the server asks for a longer wait than
+        the cap, in which case the error is raised so the caller can
+        schedule the retry itself.
+    """
+    delay = None
+    if response.status_code == 429:
+        delay = _parse_retry_after(response.headers.get("Retry-After"), time.time())
+        if delay is not None and delay > _MAX_RETRY_DELAY:
+            return None
+    if delay is None:
+        delay = min(_BACKOFF_BASE * (2**attempt), _MAX_RETRY_DELAY)
+    return delay + random.uniform(0, _BACKOFF_JITTER)
+
+
+def _default_headers(api_key: str) -> dict:
+    """Build the headers sent with every API request."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "User-Agent": "meshlogic-python/0.1.0",
+    }
+
+
+# Reusable JSON codecs for request and response bodies
+_JSON_ENCODER = msgspec.json.Encoder()
+_JSON_DECODER = msgspec.json.Decoder()
+
+
+def _encode_json(body: Optional[dict]) -> Optional[bytes]:
+    """
+    Serialize a request body once, up front.
+
+    The bytes are reused across retries and sent as-is, bypassing httpx's
+    stdlib JSON encoding; the client's default Content-Type already
+    declares JSON.
+    """
+    return _JSON_ENCODER.encode(body) if body is not None else None
+
+
+def _decode_json(content: bytes) -> dict:
+    """
+    Decode a JSON response body, treating an empty body as ``{}``.
+
+    Raises:
+        MeshLogicError: If the body is not valid JSON
+    """
+    try:
+        return _JSON_DECODER.decode(content) if content else {}
+    except (msgspec.DecodeError, msgspec.ValidationError) as exc:
+        raise MeshLogicError(f"Invalid API response: {exc}", code="INVALID_RESPONSE") from exc
+
+
+def _raise_for_status(response: httpx.Response, path: str) -> None:
+    """
+    Map an error response to the matching SDK exception.
+
+    Shared by the sync and async clients so both surface identical errors.
+
+    Raises:
+        AuthenticationError: On 401
+        NotFoundError: On 404
+        RateLimitError: On 429
+        MeshLogicError: On any other 4xx/5xx
+    """
+    if response.status_code == 401:
+        raise AuthenticationError("Invalid or expired API key")
+    elif response.status_code == 404:
+        raise NotFoundError(f"Resource not found: {path}")
+    elif response.status_code == 429:
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"), time.time())
+        if retry_after is None:
+            retry_after = _DEFAULT_RETRY_AFTER
+        raise RateLimitError(
+            "Rate limit exceeded",
+            retry_after=math.ceil(retry_after),
+        )
+    elif response.status_code >= 400:
+        try:
+            error_data = _decode_json(response.content)
+        except MeshLogicError:
+            # e.g. an HTML error page from a proxy or load balancer
+            error_data = {}
+        raise MeshLogicError(
+            message=error_data.get("message", "Unknown error"),
+            code=error_data.get("code", "UNKNOWN"),
+            status_code=response.status_code,
+        )
+
+
+# Process-wide HTTP clients keyed by (api_key, base_url, timeout, http2), so
+# short-lived MeshLogicClient instances reuse warm connections
+_shared_http: Dict[Tuple[str, str, float, bool], httpx.Client] = {}
+_shared_http_lock = threading.Lock()
+
+
+def _build_http(api_key: str, base_url: str, timeout: float, http2: bool) -> httpx.Client:
+    """Return the shared HTTP client for these settings, creating it on first use."""
+    key = (api_key, base_url, timeout, http2)
+    with _shared_http_lock:
+        http = _shared_http.get(key)
+        if http is None or http.is_closed:
+            http = httpx.Client(
+                base_url=base_url,
+                headers=_default_headers(api_key),
+                timeout=timeout,
+                http2=http2,
+                limits=DEFAULT_LIMITS,
+            )
+            _shared_http[key] = http
+        return http
+
 
 @dataclass
 class ClientConfig:
     """Configuration for MeshLogic client."""
 
     api_key: str
-    region: str = "ap-southeast-2"
+    region: str = DEFAULT_REGION
     base_url: Optional[str] = None
     timeout: float = 30.0
     max_retries: int = 3
@@ -46,6 +232,12 @@ class MeshLogicClient:
     """
     MeshLogic API client.
 
+    The client holds a pooled HTTP/2 connection for its whole lifetime, so
+    create one instance and reuse it across calls rather than constructing a
+    new client per request. Clients created with the same API key, endpoint,
+    timeout and HTTP/2 setting share one connection pool, so repeated
+    construction does not pay a fresh TCP/TLS handshake.
+
     Example:
         >>> client = MeshLogicClient(api_key="your-api-key")
         >>> events = client.events.list(event_type="process", limit=100)
@@ -56,10 +248,15 @@ class MeshLogicClient:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        region: str = "ap-southeast-2",
+        region: str = DEFAULT_REGION,
         base_url: Optional[str] = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        http2: bool = True,
+        retry_on_status: Iterable[int] = RETRY_ON_STATUS,
+        cache: Optional[Cache] = None,
+        catalog_ttl: float = 60.0,
+        device_cache_ttl: float = 0.0,
     ):
         """
         Initialize the MeshLogic client.
@@ -71,92 +268,209 @@ class MeshLogicClient:
             base_url: Override the API base URL. Optional.
             timeout: Request timeout in seconds. Default: 30.0
             max_retries: Maximum number of retry attempts. Default: 3
+            http2: Negotiate HTTP/2 so concurrent calls share one connection.
+                   Default: True
+            retry_on_status: Response statuses that are retried with backoff.
+                             Default: 429, 502, 503, 504
+            cache: Cache for GET responses, revalidated with ETag /
+                   Last-Modified. Default: None (no caching)
+            catalog_ttl: Seconds to reuse pattern listings before fetching
+                         them again; 0 disables. Default: 60.0
+            device_cache_ttl: Seconds to reuse device lookups. Cached devices
+                              can report a stale status and last_seen, so
+                              this is off by default. Default: 0.0
 
         Raises:
             AuthenticationError: If no API key is provided or found.
         """
-        self._api_key = api_key or os.environ.get("MESHLOGIC_API_KEY")
-        if not self._api_key:
+        api_key = api_key or os.environ.get("MESHLOGIC_API_KEY")
+        if not api_key:
             raise AuthenticationError(
                 "API key required. Provide via api_key parameter or "
                 "MESHLOGIC_API_KEY environment variable."
             )
+        self._api_key = api_key
 
         self._region = region
-        self._base_url = base_url or ENDPOINTS.get(region, ENDPOINTS["ap-southeast-2"])
+        self._base_url = base_url or ENDPOINTS.get(region, _DEFAULT_ENDPOINT)
         self._timeout = timeout
         self._max_retries = max_retries
+        self._retry_on_status = frozenset(retry_on_status)
+        self._cache = cache
+        self._cache_namespace = cache_namespace(self._base_url, self._api_key)
+        self._catalog_ttl = catalog_ttl
+        self._device_cache_ttl = device_cache_ttl
 
-        # Initialize HTTP client
-        self._http = httpx.Client(
-            base_url=self._base_url,
-            headers={
-                "Authorization": f"Bearer {self._api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": f"meshlogic-python/0.1.0",
-            },
-            timeout=timeout,
-        )
+        # Initialize HTTP client, shared with other clients using the same settings
+        self._http2 = http2
+        self._http = _build_http(self._api_key, self._base_url, timeout, http2)
 
         # Initialize resource handlers
         self.events = EventsResource(self)
         self.devices = DevicesResource(self)
         self.patterns = PatternsResource(self)
 
+    def _pool(self) -> httpx.Client:
+        """
+        Return the shared HTTP client, re-acquiring it after ``shutdown_all()``.
+        """
+        if self._http.is_closed:
+            self._http = _build_http(self._api_key, self._base_url, self._timeout, self._http2)
+        return self._http
+
     def _request(
         self,
         method: str,
         path: str,
         params: Optional[dict] = None,
         json: Optional[dict] = None,
+        idempotency_key: Optional[str] = None,
     ) -> dict:
         """
-        Make an API request.
+        Make an API request and decode the JSON response.
+
+        Accepts the same arguments as ``_request_raw``.
+
+        Returns:
+            Response JSON as dictionary
+        """
+        content = self._request_raw(
+            method,
+            path,
+            params=params,
+            json=json,
+            idempotency_key=idempotency_key,
+        )
+        return _decode_json(content)
+
+    def _request_raw(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        json: Optional[dict] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> bytes:
+        """
+        Make an API request and return the undecoded response body.
+
+        Used by resources that decode responses straight into typed objects.
+
+        Retryable failures are re-sent up to ``max_retries`` times. Requests
+        with non-idempotent methods are only retried when an idempotency key
+        is given. When the client has a cache, GET responses are served from
+        it while fresh and revalidated with a conditional request once stale.
 
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API endpoint path
             params: Query parameters
             json: JSON body
+            idempotency_key: Sent as the Idempotency-Key header. Optional.
 
         Returns:
-            Response JSON as dictionary
+            Response body as bytes
 
         Raises:
             MeshLogicError: On API error
             RateLimitError: When rate limited
             NotFoundError: When resource not found
         """
-        response = self._http.request(
-            method=method,
-            url=path,
-            params=params,
-            json=json,
-        )
+        headers = _request_headers(idempotency_key)
+        retryable = _can_retry(method, idempotency_key)
+        content = _encode_json(json)
 
-        if response.status_code == 401:
-            raise AuthenticationError("Invalid or expired API key")
-        elif response.status_code == 404:
-            raise NotFoundError(f"Resource not found: {path}")
-        elif response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", 60))
-            raise RateLimitError(
-                "Rate limit exceeded",
-                retry_after=retry_after,
-            )
-        elif response.status_code >= 400:
-            error_data = response.json() if response.content else {}
-            raise MeshLogicError(
-                message=error_data.get("message", "Unknown error"),
-                code=error_data.get("code", "UNKNOWN"),
-                status_code=response.status_code,
+        cache = self._cache if method.upper() == "GET" else None
+        entry: Optional[CacheEntry] = None
+        if cache is not None:
+            key = cache_key(self._cache_namespace, path, params)
+            entry = cache.get(key)
+            if entry is not None:
+                if entry.is_fresh():
+                    return entry.content
+                headers = {**(headers or {}), **entry.validators()}
+
+        for attempt in range(self._max_retries + 1):
+            response = self._pool().request(
+                method=method,
+                url=path,
+                params=params,
+                content=content,
+                headers=headers,
             )
+            if (
+                not retryable
+                or attempt == self._max_retries
+                or response.status_code not in self._retry_on_status
+            ):
+                break
+            delay = _retry_delay(response, attempt)
+            if delay is None:
+                break
+            time.sleep(delay)
+
+        if cache is not None and entry is not None and response.status_code == 304:
+            cache.set(key, entry.revalidated(response))
+            return entry.content
+
+        _raise_for_status(response, path)
+        if cache is not None:
+            fresh_entry = CacheEntry.from_response(response)
+            if fresh_entry is not None:
+                cache.set(key, fresh_entry)
+        return response.content
+
+    @contextmanager
+    def _stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+    ) -> Iterator[httpx.Response]:
+        """
+        Open a streaming API request.
 
-        return response.json() if response.content else {}
+        The response body is not read up front, so large downloads can be
+        consumed chunk by chunk.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path
+            params: Query parameters
+
+        Yields:
+            The open response
+
+        Raises:
+            MeshLogicError: On API error
+        """
+        with self._pool().stream(method, path, params=params) as response:
+            if response.status_code >= 400:
+                response.read()
+                _raise_for_status(response, path)
+            yield response
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._http.close()
+        """
+        Release the client.
+
+        This is a no-op: the underlying HTTP connection pool is shared with
+        other clients using the same settings and stays open for reuse. Call
+        ``MeshLogicClient.shutdown_all()`` to close the shared pools.
+        """
+
+    @staticmethod
+    def shutdown_all() -> None:
+        """
+        Close every shared HTTP connection pool, e.g. at process exit.
+
+        Existing clients stay usable: their next request opens a new pool.
+        """
+        with _shared_http_lock:
+            clients = list(_shared_http.values())
+            _shared_http.clear()
+        for http in clients:
+            http.close()
 
     def __enter__(self) -> MeshLogicClient:
         return self
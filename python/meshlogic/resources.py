@@ -7,13 +7,179 @@ Licensed under the Apache License, Version 2.0
 
 from __future__ import annotations
 
-from typing import Iterator, List, Optional, TYPE_CHECKING
-
-from .types import Event, Device, Pattern, PatternMatch
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+import msgspec
+
+from .cache import _ResultCache
+from .exceptions import MeshLogicError
+from .types import (
+    Device,
+    Event,
+    Pattern,
+    PatternMatch,
+    _DevicesPage,
+    _EventsPage,
+    _MatchesPage,
+    _PatternsPage,
+)
 
 if TYPE_CHECKING:
+    from .async_client import AsyncMeshLogicClient
     from .client import MeshLogicClient
 
+T = TypeVar("T")
+
+
+# Reusable decoders, so each response type's schema is compiled only once
+_EVENTS_DECODER = msgspec.json.Decoder(_EventsPage)
+_DEVICES_DECODER = msgspec.json.Decoder(_DevicesPage)
+_DEVICE_DECODER = msgspec.json.Decoder(Device)
+_PATTERNS_DECODER = msgspec.json.Decoder(_PatternsPage)
+_MATCHES_DECODER = msgspec.json.Decoder(_MatchesPage)
+# Stream envelopes are decoded untyped: only "event" frames have a schema
+_FRAME_DECODER = msgspec.json.Decoder()
+
+# Most stream messages decoded in one pass
+_STREAM_BATCH_SIZE = 1024
+
+# Most stream messages buffered ahead of the consumer. When the buffer is
+# full the reader thread stops reading, so TCP pushes back on the server.
+_STREAM_QUEUE_SIZE = _STREAM_BATCH_SIZE
+
+# Keepalive pings for the sync stream, in seconds, so a silently dropped
+# connection is detected and reconnected like the async stream's
+_STREAM_PING_INTERVAL = 20
+_STREAM_PING_TIMEOUT = 10
+
+
+def _decode(content: bytes, decoder: msgspec.json.Decoder[T]) -> T:
+    """
+    Decode a response body directly into the decoder's type.
+
+    Raises:
+        MeshLogicError: If the body is not valid JSON or does not match the type
+    """
+    try:
+        return decoder.decode(content or b"{}")
+    except (msgspec.DecodeError, msgspec.ValidationError) as exc:
+        raise MeshLogicError(f"Invalid API response: {exc}", code="INVALID_RESPONSE") from exc
+
+
+def _stream_url(base_url: str) -> str:
+    """WebSocket URL of the event stream for an API base URL."""
+    if base_url.startswith("http"):
+        base_url = "ws" + base_url[len("http") :]
+    return base_url + "/v1/events/stream"
+
+
+def _subscribe_message(
+    event_types: Optional[List[str]],
+    device_ids: Optional[List[str]],
+) -> dict:
+    """Build the subscription message sent when a stream connects."""
+    subscription: dict = {"type": "subscribe"}
+    if event_types:
+        subscription["event_types"] = event_types
+    if device_ids:
+        subscription["device_ids"] = device_ids
+    return subscription
+
+
+def _decode_frames(frames: List[bytes]) -> Iterator[Event]:
+    """
+    Decode a batch of stream messages in a single pass, yielding events.
+
+    Frames of other types are ignored. If the batch contains malformed JSON,
+    the frames are decoded one at a time and the malformed ones are skipped.
+    Events are built one at a time as they are yielded, so an event that
+    fails to build does not hold back the ones before it.
+    """
+    try:
+        if len(frames) == 1:
+            decoded = [_FRAME_DECODER.decode(frames[0])]
+        else:
+            decoded = _FRAME_DECODER.decode(b"[" + b",".join(frames) + b"]")
+    except msgspec.DecodeError:
+        decoded = []
+        for frame in frames:
+            try:
+                decoded.append(_FRAME_DECODER.decode(frame))
+            except msgspec.DecodeError:
+                continue
+    for data in decoded:
+        if isinstance(data, dict) and data.get("type") == "event" and data.get("event"):
+            yield Event.from_dict(data["event"])
+
+
+def _iter_pages(fetch: Callable[[int], List[T]], page_size: int) -> Iterator[T]:
+    """
+    Yield items from consecutive offset pages.
+
+    The next page is requested on a background thread while the caller
+    works through the current one. Iteration stops at the first short page.
+
+    Raises:
+        ValueError: If ``page_size`` is less than 1
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(fetch, 0)
+    offset = 0
+    try:
+        while True:
+            page = future.result()
+            if len(page) < page_size:
+                yield from page
+                return
+            offset += page_size
+            future = executor.submit(fetch, offset)
+            yield from page
+    finally:
+        future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def _aiter_pages(
+    fetch: Callable[[int], Awaitable[List[T]]],
+    page_size: int,
+) -> AsyncGenerator[T, None]:
+    """Async counterpart of ``_iter_pages``, prefetching with a task."""
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    task = asyncio.ensure_future(fetch(0))
+    offset = 0
+    try:
+        while True:
+            page = await task
+            if len(page) < page_size:
+                for item in page:
+                    yield item
+                return
+            offset += page_size
+            task = asyncio.ensure_future(fetch(offset))
+            for item in page:
+                yield item
+    finally:
+        task.cancel()
+
 
 class EventsResource:
     """Events API resource."""
@@ -54,8 +220,45 @@ class EventsResource:
         if until:
             params["until"] = until
 
-        response = self._client._request("GET", "/v1/events", params=params)
-        return [Event.from_dict(e) for e in response.get("events", [])]
+        content = self._client._request_raw("GET", "/v1/events", params=params)
+        return [Event.from_dict(e) for e in _decode(content, _EVENTS_DECODER).events]
+
+    def iter_all(
+        self,
+        event_type: Optional[str] = None,
+        device_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> Iterator[Event]:
+        """
+        Iterate over every matching event, page by page.
+
+        The next page is fetched while the current one is being consumed,
+        hiding most of the request latency for full scans.
+
+        Args:
+            event_type: Filter by event type (process, file, network)
+            device_id: Filter by device ID
+            since: Start time (ISO format or relative like "1h", "24h")
+            until: End time (ISO format or relative)
+            page_size: Events per request (default: 1000, max: 1000)
+
+        Yields:
+            Event objects
+        """
+
+        def fetch(offset: int) -> List[Event]:
+            return self.list(
+                event_type=event_type,
+                device_id=device_id,
+                since=since,
+                until=until,
+                limit=page_size,
+                offset=offset,
+            )
+
+        yield from _iter_pages(fetch, page_size)
 
     def get(self, event_id: str) -> Event:
         """
@@ -70,54 +273,141 @@ class EventsResource:
         response = self._client._request("GET", f"/v1/events/{event_id}")
         return Event.from_dict(response)
 
+    def get_many(self, event_ids: List[str], concurrency: int = 16) -> List[Event]:
+        """
+        Get several events by ID concurrently.
+
+        Requests are spread over up to ``concurrency`` threads sharing the
+        client's connection pool. Keep ``concurrency`` modest to stay within
+        the API rate limit; rate-limited requests are retried as usual.
+
+        Args:
+            event_ids: The event IDs
+            concurrency: Maximum number of requests in flight (default: 16)
+
+        Returns:
+            Event objects in the same order as ``event_ids``
+
+        Raises:
+            ValueError: If ``concurrency`` is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if not event_ids:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(event_ids))) as executor:
+            return list(executor.map(self.get, event_ids))
+
     def stream(
         self,
         event_types: Optional[List[str]] = None,
         device_ids: Optional[List[str]] = None,
+        reconnect_delay: int = 5,
     ) -> Iterator[Event]:
         """
         Stream events in real-time via WebSocket.
 
+        The connection runs on a background thread and is re-established
+        automatically after transient failures, re-sending the subscription
+        each time, so a network blip does not end the stream. Keepalive pings
+        detect connections that drop silently, e.g. at a NAT timeout. Only a
+        bounded number of messages is buffered; if the caller falls behind,
+        reading pauses until it catches up.
+
         Args:
             event_types: Filter by event types
             device_ids: Filter by device IDs
+            reconnect_delay: Seconds to wait before reconnecting (default: 5)
 
         Yields:
             Event objects as they arrive
 
+        Raises:
+            websocket.WebSocketException: If the initial connection fails
+
         Note:
             This is a blocking operation. Use in a separate thread if needed.
         """
-        import websocket
         import json
 
-        ws_url = self._client._base_url.replace("https://", "wss://")
-        ws_url = f"{ws_url}/v1/events/stream"
-
-        headers = {
-            "Authorization": f"Bearer {self._client._api_key}",
-        }
+        import websocket
 
-        ws = websocket.create_connection(ws_url, header=headers)
+        subscription = json.dumps(_subscribe_message(event_types, device_ids))
+        messages: queue.Queue = queue.Queue(maxsize=_STREAM_QUEUE_SIZE)
+        connected = threading.Event()
+        stopped = threading.Event()
+
+        def enqueue(item: object) -> None:
+            # Block while the consumer is behind, but give up once it has gone
+            while not stopped.is_set():
+                try:
+                    messages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def on_open(app: websocket.WebSocketApp) -> None:
+            connected.set()
+            app.send(subscription)
+
+        def on_error(app: websocket.WebSocketApp, error: Exception) -> None:
+            # Only a failed first connection is fatal; later drops reconnect
+            if not connected.is_set():
+                enqueue(error)
+                app.close()
+
+        app = websocket.WebSocketApp(
+            _stream_url(self._client._base_url),
+            header={"Authorization": f"Bearer {self._client._api_key}"},
+            on_open=on_open,
+            on_reconnect=on_open,
+            on_message=lambda app, message: enqueue(message),
+            on_error=on_error,
+        )
+
+        def run() -> None:
+            try:
+                app.run_forever(
+                    reconnect=reconnect_delay,
+                    ping_interval=_STREAM_PING_INTERVAL,
+                    ping_timeout=_STREAM_PING_TIMEOUT,
+                )
+            finally:
+                enqueue(None)
+
+        threading.Thread(target=run, name="meshlogic-event-stream", daemon=True).start()
 
         try:
-            # Send subscription message
-            subscription = {}
-            if event_types:
-                subscription["event_types"] = event_types
-            if device_ids:
-                subscription["device_ids"] = device_ids
-
-            ws.send(json.dumps({"type": "subscribe", **subscription}))
-
             while True:
-                message = ws.recv()
-                if message:
-                    data = json.loads(message)
-                    if data.get("type") == "event":
-                        yield Event.from_dict(data["event"])
+                # Block for one message, then take whatever else has already
+                # arrived so high-rate streams are decoded in batches.
+                batch = [messages.get()]
+                while len(batch) < _STREAM_BATCH_SIZE:
+                    try:
+                        batch.append(messages.get_nowait())
+                    except queue.Empty:
+                        break
+
+                frames = []
+                stop = False
+                for message in batch:
+                    if message is None or isinstance(message, Exception):
+                        stop = True
+                        break
+                    if not message:
+                        continue
+                    frames.append(message.encode() if isinstance(message, str) else message)
+
+                if frames:
+                    yield from _decode_frames(frames)
+                if stop:
+                    if isinstance(message, Exception):
+                        raise message
+                    return
         finally:
-            ws.close()
+            stopped.set()
+            app.close()
 
     def export(
         self,
@@ -125,18 +415,30 @@ class EventsResource:
         event_type: Optional[str] = None,
         since: Optional[str] = None,
         until: Optional[str] = None,
-    ) -> bytes:
+        out: Optional[BinaryIO] = None,
+        chunk_size: int = 1 << 20,
+    ) -> Optional[Iterator[bytes]]:
         """
         Export events to file.
 
+        The export is streamed rather than buffered, so memory use stays at
+        roughly one chunk regardless of the export size.
+
+        Example:
+            >>> with open("events.parquet", "wb") as f:
+            ...     client.events.export(format="parquet", since="7d", out=f)
+
         Args:
             format: Export format (json, csv, parquet)
             event_type: Filter by event type
             since: Start time
             until: End time
+            out: Binary file object to write the export to. Optional.
+            chunk_size: Maximum chunk size in bytes (default: 1 MiB)
 
         Returns:
-            File contents as bytes
+            An iterator of file content chunks, or None when written to ``out``.
+            Without ``out`` the request is sent once iteration starts.
         """
         params = {"format": format}
         if event_type:
@@ -146,15 +448,31 @@ class EventsResource:
         if until:
             params["until"] = until
 
-        response = self._client._http.get("/v1/events/export", params=params)
-        return response.content
+        chunks = self._iter_export(params, chunk_size)
+        if out is None:
+            return chunks
+
+        for chunk in chunks:
+            out.write(chunk)
+        return None
+
+    def _iter_export(self, params: dict, chunk_size: int) -> Iterator[bytes]:
+        """Yield export chunks as they are received."""
+        with self._client._stream("GET", "/v1/events/export", params=params) as response:
+            yield from response.iter_bytes(chunk_size)
 
 
 class DevicesResource:
-    """Devices API resource."""
+    """
+    Devices API resource.
+
+    Device lookups are cached for the client's ``device_cache_ttl``, which
+    is off by default because devices report live status.
+    """
 
     def __init__(self, client: MeshLogicClient):
         self._client = client
+        self._catalog = _ResultCache(ttl=client._device_cache_ttl)
 
     def list(
         self,
@@ -181,8 +499,38 @@ class DevicesResource:
         if platform:
             params["platform"] = platform
 
-        response = self._client._request("GET", "/v1/devices", params=params)
-        return [Device.from_dict(d) for d in response.get("devices", [])]
+        key = ("list", status, platform, limit, offset)
+        devices = self._catalog.get(key)
+        if devices is None:
+            content = self._client._request_raw("GET", "/v1/devices", params=params)
+            devices = _decode(content, _DEVICES_DECODER).devices
+            self._catalog.set(key, devices)
+        return [replace(device) for device in devices]
+
+    def iter_all(
+        self,
+        status: Optional[str] = None,
+        platform: Optional[str] = None,
+        page_size: int = 100,
+    ) -> Iterator[Device]:
+        """
+        Iterate over every matching device, page by page.
+
+        The next page is fetched while the current one is being consumed.
+
+        Args:
+            status: Filter by status (online, offline, degraded)
+            platform: Filter by platform (linux, macos, windows)
+            page_size: Devices per request (default: 100)
+
+        Yields:
+            Device objects
+        """
+
+        def fetch(offset: int) -> List[Device]:
+            return self.list(status=status, platform=platform, limit=page_size, offset=offset)
+
+        yield from _iter_pages(fetch, page_size)
 
     def get(self, device_id: str) -> Device:
         """
@@ -194,8 +542,13 @@ class DevicesResource:
         Returns:
             Device object
         """
-        response = self._client._request("GET", f"/v1/devices/{device_id}")
-        return Device.from_dict(response)
+        key = ("get", device_id)
+        device = self._catalog.get(key)
+        if device is None:
+            content = self._client._request_raw("GET", f"/v1/devices/{device_id}")
+            device = _decode(content, _DEVICE_DECODER)
+            self._catalog.set(key, device)
+        return replace(device)
 
     def status(self) -> dict:
         """
@@ -206,12 +559,21 @@ class DevicesResource:
         """
         return self._client._request("GET", "/v1/devices/status")
 
+    def invalidate(self) -> None:
+        """Drop cached device lookups so the next call fetches fresh data."""
+        self._catalog.clear()
+
 
 class PatternsResource:
-    """Patterns API resource."""
+    """
+    Patterns API resource.
+
+    Pattern listings are cached for the client's ``catalog_ttl``.
+    """
 
     def __init__(self, client: MeshLogicClient):
         self._client = client
+        self._catalog = _ResultCache(ttl=client._catalog_ttl)
 
     def list(
         self,
@@ -234,8 +596,13 @@ class PatternsResource:
         if enabled is not None:
             params["enabled"] = str(enabled).lower()
 
-        response = self._client._request("GET", "/v1/patterns", params=params)
-        return [Pattern.from_dict(p) for p in response.get("patterns", [])]
+        key = (category, enabled)
+        patterns = self._catalog.get(key)
+        if patterns is None:
+            content = self._client._request_raw("GET", "/v1/patterns", params=params)
+            patterns = _decode(content, _PATTERNS_DECODER).patterns
+            self._catalog.set(key, patterns)
+        return [replace(pattern) for pattern in patterns]
 
     def matches(
         self,
@@ -264,5 +631,375 @@ class PatternsResource:
         if since:
             params["since"] = since
 
-        response = self._client._request("GET", "/v1/patterns/matches", params=params)
-        return [PatternMatch.from_dict(m) for m in response.get("matches", [])]
+        content = self._client._request_raw("GET", "/v1/patterns/matches", params=params)
+        return _decode(content, _MATCHES_DECODER).matches
+
+    def invalidate(self) -> None:
+        """Drop cached pattern lookups so the next call fetches fresh data."""
+        self._catalog.clear()
+
+
+class AsyncEventsResource:
+    """Events API resource for the asynchronous client."""
+
+    def __init__(self, client: AsyncMeshLogicClient):
+        self._client = client
+
+    async def list(
+        self,
+        event_type: Optional[str] = None,
+        device_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Event]:
+        """
+        List events with optional filtering.
+
+        Pages can be fetched concurrently by gathering calls with different
+        offsets.
+
+        Args:
+            event_type: Filter by event type (process, file, network)
+            device_id: Filter by device ID
+            since: Start time (ISO format or relative like "1h", "24h")
+            until: End time (ISO format or relative)
+            limit: Maximum number of events to return (default: 100, max: 1000)
+            offset: Pagination offset
+
+        Returns:
+            List of Event objects
+        """
+        params = {"limit": limit, "offset": offset}
+        if event_type:
+            params["type"] = event_type
+        if device_id:
+            params["device_id"] = device_id
+        if since:
+            params["since"] = since
+        if until:
+            params["until"] = until
+
+        content = await self._client._request_raw("GET", "/v1/events", params=params)
+        return [Event.from_dict(e) for e in _decode(content, _EVENTS_DECODER).events]
+
+    async def iter_all(
+        self,
+        event_type: Optional[str] = None,
+        device_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[Event]:
+        """
+        Iterate over every matching event, page by page.
+
+        The next page is fetched while the current one is being consumed,
+        hiding most of the request latency for full scans.
+
+        Args:
+            event_type: Filter by event type (process, file, network)
+            device_id: Filter by device ID
+            since: Start time (ISO format or relative like "1h", "24h")
+            until: End time (ISO format or relative)
+            page_size: Events per request (default: 1000, max: 1000)
+
+        Yields:
+            Event objects
+        """
+
+        def fetch(offset: int) -> Awaitable[List[Event]]:
+            return self.list(
+                event_type=event_type,
+                device_id=device_id,
+                since=since,
+                until=until,
+                limit=page_size,
+                offset=offset,
+            )
+
+        pages = _aiter_pages(fetch, page_size)
+        try:
+            async for event in pages:
+                yield event
+        finally:
+            await pages.aclose()
+
+    async def get(self, event_id: str) -> Event:
+        """
+        Get a specific event by ID.
+
+        Example:
+            >>> events = await asyncio.gather(*(client.events.get(i) for i in ids))
+
+        Args:
+            event_id: The event ID
+
+        Returns:
+            Event object
+        """
+        response = await self._client._request("GET", f"/v1/events/{event_id}")
+        return Event.from_dict(response)
+
+    async def stream(
+        self,
+        event_types: Optional[List[str]] = None,
+        device_ids: Optional[List[str]] = None,
+    ) -> AsyncIterator[Event]:
+        """
+        Stream events in real-time via WebSocket.
+
+        The connection is re-established automatically after transient
+        failures, re-sending the subscription each time.
+
+        Args:
+            event_types: Filter by event types
+            device_ids: Filter by device IDs
+
+        Yields:
+            Event objects as they arrive
+
+        Raises:
+            OSError: If the initial connection fails
+        """
+        import json
+
+        from websockets.asyncio.client import connect, process_exception  # type: ignore[attr-defined]
+        from websockets.exceptions import ConnectionClosed
+
+        subscription = json.dumps(_subscribe_message(event_types, device_ids))
+        headers = {"Authorization": f"Bearer {self._client._api_key}"}
+        connected = False
+
+        def on_connect_error(error: Exception) -> Optional[Exception]:
+            # Only a failed first connection is fatal; later drops reconnect
+            return process_exception(error) if connected else error
+
+        async for ws in connect(
+            _stream_url(self._client._base_url),
+            additional_headers=headers,
+            process_exception=on_connect_error,
+        ):
+            connected = True
+            try:
+                await ws.send(subscription)
+                async for message in ws:
+                    if message:
+                        frame = message.encode() if isinstance(message, str) else message
+                        for event in _decode_frames([frame]):
+                            yield event
+            except ConnectionClosed:
+                continue
+            finally:
+                await ws.close()
+
+    async def get_many(self, event_ids: List[str], concurrency: int = 16) -> List[Event]:
+        """
+        Get several events by ID concurrently.
+
+        At most ``concurrency`` requests are in flight at once. Keep it
+        modest to stay within the API rate limit; rate-limited requests are
+        retried as usual.
+
+        Args:
+            event_ids: The event IDs
+            concurrency: Maximum number of requests in flight (default: 16)
+
+        Returns:
+            Event objects in the same order as ``event_ids``
+
+        Raises:
+            ValueError: If ``concurrency`` is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get(event_id: str) -> Event:
+            async with semaphore:
+                return await self.get(event_id)
+
+        return list(await asyncio.gather(*(get(i) for i in event_ids)))
+
+
+class AsyncDevicesResource:
+    """
+    Devices API resource for the asynchronous client.
+
+    Device lookups are cached for the client's ``device_cache_ttl``, which
+    is off by default because devices report live status.
+    """
+
+    def __init__(self, client: AsyncMeshLogicClient):
+        self._client = client
+        self._catalog = _ResultCache(ttl=client._device_cache_ttl)
+
+    async def list(
+        self,
+        status: Optional[str] = None,
+        platform: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Device]:
+        """
+        List monitored devices.
+
+        Args:
+            status: Filter by status (online, offline, degraded)
+            platform: Filter by platform (linux, macos, windows)
+            limit: Maximum number of devices to return
+            offset: Pagination offset
+
+        Returns:
+            List of Device objects
+        """
+        params = {"limit": limit, "offset": offset}
+        if status:
+            params["status"] = status
+        if platform:
+            params["platform"] = platform
+
+        key = ("list", status, platform, limit, offset)
+        devices = self._catalog.get(key)
+        if devices is None:
+            content = await self._client._request_raw("GET", "/v1/devices", params=params)
+            devices = _decode(content, _DEVICES_DECODER).devices
+            self._catalog.set(key, devices)
+        return [replace(device) for device in devices]
+
+    async def iter_all(
+        self,
+        status: Optional[str] = None,
+        platform: Optional[str] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Device]:
+        """
+        Iterate over every matching device, page by page.
+
+        The next page is fetched while the current one is being consumed.
+
+        Args:
+            status: Filter by status (online, offline, degraded)
+            platform: Filter by platform (linux, macos, windows)
+            page_size: Devices per request (default: 100)
+
+        Yields:
+            Device objects
+        """
+
+        def fetch(offset: int) -> Awaitable[List[Device]]:
+            return self.list(status=status, platform=platform, limit=page_size, offset=offset)
+
+        pages = _aiter_pages(fetch, page_size)
+        try:
+            async for device in pages:
+                yield device
+        finally:
+            await pages.aclose()
+
+    async def get(self, device_id: str) -> Device:
+        """
+        Get a specific device by ID.
+
+        Args:
+            device_id: The device ID
+
+        Returns:
+            Device object
+        """
+        key = ("get", device_id)
+        device = self._catalog.get(key)
+        if device is None:
+            content = await self._client._request_raw("GET", f"/v1/devices/{device_id}")
+            device = _decode(content, _DEVICE_DECODER)
+            self._catalog.set(key, device)
+        return replace(device)
+
+    async def status(self) -> dict:
+        """
+        Get overall device fleet status.
+
+        Returns:
+            Dictionary with status counts
+        """
+        return await self._client._request("GET", "/v1/devices/status")
+
+    def invalidate(self) -> None:
+        """Drop cached device lookups so the next call fetches fresh data."""
+        self._catalog.clear()
+
+
+class AsyncPatternsResource:
+    """
+    Patterns API resource for the asynchronous client.
+
+    Pattern listings are cached for the client's ``catalog_ttl``.
+    """
+
+    def __init__(self, client: AsyncMeshLogicClient):
+        self._client = client
+        self._catalog = _ResultCache(ttl=client._catalog_ttl)
+
+    async def list(
+        self,
+        category: Optional[str] = None,
+        enabled: Optional[bool] = None,
+    ) -> List[Pattern]:
+        """
+        List detection patterns.
+
+        Args:
+            category: Filter by category
+            enabled: Filter by enabled status
+
+        Returns:
+            List of Pattern objects
+        """
+        params = {}
+        if category:
+            params["category"] = category
+        if enabled is not None:
+            params["enabled"] = str(enabled).lower()
+
+        key = (category, enabled)
+        patterns = self._catalog.get(key)
+        if patterns is None:
+            content = await self._client._request_raw("GET", "/v1/patterns", params=params)
+            patterns = _decode(content, _PATTERNS_DECODER).patterns
+            self._catalog.set(key, patterns)
+        return [replace(pattern) for pattern in patterns]
+
+    async def matches(
+        self,
+        pattern_id: Optional[str] = None,
+        device_id: Optional[str] = None,
+        since: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[PatternMatch]:
+        """
+        Get pattern match history.
+
+        Args:
+            pattern_id: Filter by pattern ID
+            device_id: Filter by device ID
+            since: Start time
+            limit: Maximum number of matches to return
+
+        Returns:
+            List of PatternMatch objects
+        """
+        params = {"limit": limit}
+        if pattern_id:
+            params["pattern_id"] = pattern_id
+        if device_id:
+            params["device_id"] = device_id
+        if since:
+            params["since"] = since
+
+        content = await self._client._request_raw("GET", "/v1/patterns/matches", params=params)
+        return _decode(content, _MATCHES_DECODER).matches
+
+    def invalidate(self) -> None:
+        """Drop cached pattern lookups so the next call fetches fresh data."""
+        self._catalog.clear()
@@ -7,10 +7,17 @@ Licensed under the Apache License, Version 2.0
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
 from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+import msgspec
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__, which
+# keeps large event lists compact and makes attribute access cheaper.
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class EventType(str, Enum):
@@ -42,7 +49,14 @@ class EventAction(str, Enum):
     RECEIVE = "receive"
 
 
-@dataclass
+# Value -> member lookups for the decode hot path. A dict lookup is much
+# cheaper than calling the Enum, which re-validates the value every time;
+# unknown values still fall through to the Enum so they raise ValueError.
+_TYPE_CACHE: Dict[str, EventType] = {t.value: t for t in EventType}
+_ACTION_CACHE: Dict[str, EventAction] = {a.value: a for a in EventAction}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Event:
     """Base event class."""
 
@@ -55,30 +69,36 @@ class Event:
     raw: Dict[str, Any] = field(default_factory=dict)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> Event:
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        *,
+        _fromiso: Callable[[str], datetime] = datetime.fromisoformat,
+        _types: Dict[str, EventType] = _TYPE_CACHE,
+        _actions: Dict[str, EventAction] = _ACTION_CACHE,
+    ) -> Event:
         """Create an Event from a dictionary."""
-        event_type = EventType(data.get("type", "process"))
+        type_value = data.get("type", "process")
+        event_type = _types.get(type_value) or EventType(type_value)
 
         # Dispatch to specific event type
-        if event_type == EventType.PROCESS:
-            return ProcessEvent.from_dict(data)
-        elif event_type == EventType.FILE:
-            return FileEvent.from_dict(data)
-        elif event_type == EventType.NETWORK:
-            return NetworkEvent.from_dict(data)
+        from_dict = _EVENT_DISPATCH.get(event_type)
+        if from_dict is not None:
+            return from_dict(data)
 
+        action = data.get("action", "exec")
         return cls(
             id=data["id"],
             type=event_type,
-            action=EventAction(data.get("action", "exec")),
-            timestamp=datetime.fromisoformat(data["timestamp"]),
+            action=_actions.get(action) or EventAction(action),
+            timestamp=_fromiso(data["timestamp"]),
             device_id=data["device_id"],
             customer_id=data["customer_id"],
             raw=data,
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessEvent(Event):
     """Process event (exec, exit, fork)."""
 
@@ -91,13 +111,21 @@ class ProcessEvent(Event):
     exit_code: Optional[int] = None
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> ProcessEvent:
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        *,
+        _fromiso: Callable[[str], datetime] = datetime.fromisoformat,
+        _types: Dict[str, EventType] = _TYPE_CACHE,
+        _actions: Dict[str, EventAction] = _ACTION_CACHE,
+    ) -> ProcessEvent:
         """Create a ProcessEvent from a dictionary."""
+        action = data.get("action", "exec")
         return cls(
             id=data["id"],
             type=EventType.PROCESS,
-            action=EventAction(data.get("action", "exec")),
-            timestamp=datetime.fromisoformat(data["timestamp"]),
+            action=_actions.get(action) or EventAction(action),
+            timestamp=_fromiso(data["timestamp"]),
             device_id=data["device_id"],
             customer_id=data["customer_id"],
             raw=data,
@@ -111,7 +139,7 @@ class ProcessEvent(Event):
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FileEvent(Event):
     """File event (open, write, delete, rename)."""
 
@@ -121,13 +149,21 @@ class FileEvent(Event):
     process_name: str = ""
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> FileEvent:
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        *,
+        _fromiso: Callable[[str], datetime] = datetime.fromisoformat,
+        _types: Dict[str, EventType] = _TYPE_CACHE,
+        _actions: Dict[str, EventAction] = _ACTION_CACHE,
+    ) -> FileEvent:
         """Create a FileEvent from a dictionary."""
+        action = data.get("action", "open")
         return cls(
             id=data["id"],
             type=EventType.FILE,
-            action=EventAction(data.get("action", "open")),
-            timestamp=datetime.fromisoformat(data["timestamp"]),
+            action=_actions.get(action) or EventAction(action),
+            timestamp=_fromiso(data["timestamp"]),
             device_id=data["device_id"],
             customer_id=data["customer_id"],
             raw=data,
@@ -138,7 +174,7 @@ class FileEvent(Event):
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class NetworkEvent(Event):
     """Network event (connect, accept, send, receive)."""
 
@@ -151,13 +187,21 @@ class NetworkEvent(Event):
     protocol: str = "tcp"
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> NetworkEvent:
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        *,
+        _fromiso: Callable[[str], datetime] = datetime.fromisoformat,
+        _types: Dict[str, EventType] = _TYPE_CACHE,
+        _actions: Dict[str, EventAction] = _ACTION_CACHE,
+    ) -> NetworkEvent:
         """Create a NetworkEvent from a dictionary."""
+        action = data.get("action", "connect")
         return cls(
             id=data["id"],
             type=EventType.NETWORK,
-            action=EventAction(data.get("action", "connect")),
-            timestamp=datetime.fromisoformat(data["timestamp"]),
+            action=_actions.get(action) or EventAction(action),
+            timestamp=_fromiso(data["timestamp"]),
             device_id=data["device_id"],
             customer_id=data["customer_id"],
             raw=data,
@@ -171,15 +215,23 @@ class NetworkEvent(Event):
         )
 
 
-@dataclass
+# Event subclass decoders by type, used by Event.from_dict
+_EVENT_DISPATCH: Dict[EventType, Callable[[Dict[str, Any]], Event]] = {
+    EventType.PROCESS: ProcessEvent.from_dict,
+    EventType.FILE: FileEvent.from_dict,
+    EventType.NETWORK: NetworkEvent.from_dict,
+}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Device:
     """Monitored device."""
 
     id: str
     hostname: str
     platform: str  # linux, macos, windows
-    os_version: str
-    agent_version: str
+    os_version: Optional[str]
+    agent_version: Optional[str]
     last_seen: datetime
     status: str  # online, offline, degraded
     customer_id: str
@@ -199,16 +251,16 @@ class Device:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Pattern:
     """Detection pattern."""
 
     id: str
     name: str
     category: str
-    description: str
+    description: Optional[str]
     severity: str  # info, low, medium, high, critical
-    enabled: bool
+    enabled: Optional[bool] = True
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Pattern:
@@ -223,7 +275,7 @@ class Pattern:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PatternMatch:
     """Pattern match result."""
 
@@ -234,7 +286,7 @@ class PatternMatch:
     device_id: str
     timestamp: datetime
     severity: str
-    details: Dict[str, Any] = field(default_factory=dict)
+    details: Optional[Dict[str, Any]] = field(default_factory=dict)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> PatternMatch:
@@ -249,3 +301,32 @@ class PatternMatch:
             severity=data["severity"],
             details=data.get("details", {}),
         )
+
+
+# Wire envelopes for list responses, decoded by msgspec straight from the
+# response bytes. Events stay as dicts because each Event keeps its raw
+# payload and is dispatched to its subclass by Event.from_dict.
+
+
+class _EventsPage(msgspec.Struct):
+    """Response body of GET /v1/events."""
+
+    events: List[Dict[str, Any]] = []
+
+
+class _DevicesPage(msgspec.Struct):
+    """Response body of GET /v1/devices."""
+
+    devices: List[Device] = []
+
+
+class _PatternsPage(msgspec.Struct):
+    """Response body of GET /v1/patterns."""
+
+    patterns: List[Pattern] = []
+
+
+class _MatchesPage(msgspec.Struct):
+    """Response body of GET /v1/patterns/matches."""
+
+    matches: List[PatternMatch] = []
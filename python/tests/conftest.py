@@ -0,0 +1,82 @@
+"""
+Shared fixtures for the MeshLogic SDK tests.
+
+Copyright (c) 2024-2026 Mesh Logic Pty Ltd
+Licensed under the Apache License, Version 2.0
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from meshlogic import AsyncMeshLogicClient, MeshLogicClient
+from meshlogic import client as client_module
+
+BASE_URL = "https://api.test.meshlogic.ai"
+
+Handler = Callable[[httpx.Request], Any]
+
+
+def event_data(event_id: str = "evt-1", **fields: Any) -> dict[str, Any]:
+    """Build an event payload as returned by the API."""
+    return {
+        "id": event_id,
+        "type": "process",
+        "action": "exec",
+        "timestamp": "2024-06-01T12:00:00+00:00",
+        "device_id": "dev-1",
+        "customer_id": "cust-1",
+        "pid": 42,
+        "process_name": "sshd",
+        **fields,
+    }
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record retry delays instead of sleeping through them."""
+    delays: list[float] = []
+
+    async def async_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(client_module.time, "sleep", delays.append)
+    monkeypatch.setattr("meshlogic.async_client.asyncio.sleep", async_sleep)
+    return delays
+
+
+@pytest.fixture
+def make_client(monkeypatch: pytest.MonkeyPatch) -> Callable[..., MeshLogicClient]:
+    """Build a MeshLogicClient whose requests are answered by ``handler``."""
+
+    def make(handler: Handler, **kwargs: Any) -> MeshLogicClient:
+        def build_http(api_key: str, base_url: str, timeout: float, http2: bool) -> httpx.Client:
+            return httpx.Client(
+                base_url=base_url,
+                headers=client_module._default_headers(api_key),
+                transport=httpx.MockTransport(handler),
+            )
+
+        monkeypatch.setattr(client_module, "_build_http", build_http)
+        return MeshLogicClient(api_key="test-key", base_url=BASE_URL, **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def make_async_client() -> Callable[..., AsyncMeshLogicClient]:
+    """Build an AsyncMeshLogicClient whose requests are answered by ``handler``."""
+
+    def make(handler: Handler, **kwargs: Any) -> AsyncMeshLogicClient:
+        client = AsyncMeshLogicClient(api_key="test-key", base_url=BASE_URL, **kwargs)
+        client._http = httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers=client_module._default_headers("test-key"),
+            transport=httpx.MockTransport(handler),
+        )
+        return client
+
+    return make
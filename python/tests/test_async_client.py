@@ -0,0 +1,123 @@
+"""Tests for the asynchronous client."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from meshlogic import AsyncMeshLogicClient, NotFoundError
+
+from .conftest import event_data
+
+
+def concurrency_tracker():
+    """Serve events slowly, recording the most requests seen in flight at once."""
+    state = {"in_flight": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        return httpx.Response(200, json=event_data(request.url.path.rsplit("/", 1)[-1]))
+
+    return handler, state
+
+
+async def test_concurrency_limit_caps_requests_in_flight(make_async_client):
+    handler, state = concurrency_tracker()
+    client = make_async_client(handler, concurrency_limit=3)
+
+    events = await asyncio.gather(*(client.events.get(f"evt-{i}") for i in range(12)))
+
+    assert len(events) == 12
+    assert state["peak"] == 3
+    await client.close()
+
+
+def test_concurrency_limit_must_be_positive():
+    with pytest.raises(ValueError):
+        AsyncMeshLogicClient(api_key="test-key", concurrency_limit=0)
+
+
+async def test_get_many_preserves_order(make_async_client):
+    ids = [f"evt-{i}" for i in range(6)]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        event_id = request.url.path.rsplit("/", 1)[-1]
+        await asyncio.sleep(0.01 * (len(ids) - ids.index(event_id)))
+        return httpx.Response(200, json=event_data(event_id))
+
+    async with make_async_client(handler) as client:
+        assert [e.id for e in await client.events.get_many(ids)] == ids
+
+
+async def test_get_many_rejects_non_positive_concurrency(make_async_client):
+    async with make_async_client(lambda request: httpx.Response(200)) as client:
+        with pytest.raises(ValueError):
+            await client.events.get_many(["evt-1"], concurrency=0)
+
+
+async def test_iter_all_walks_every_page(make_async_client):
+    offsets = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        offsets.append(offset)
+        ids = range(offset, min(offset + 2, 5))
+        return httpx.Response(200, json={"events": [event_data(f"evt-{i}") for i in ids]})
+
+    async with make_async_client(handler) as client:
+        events = [event async for event in client.events.iter_all(page_size=2)]
+
+    assert [e.id for e in events] == [f"evt-{i}" for i in range(5)]
+    assert offsets == [0, 2, 4]
+
+
+async def test_iter_all_rejects_non_positive_page_size(make_async_client):
+    async with make_async_client(lambda request: httpx.Response(200)) as client:
+        with pytest.raises(ValueError):
+            async for _ in client.devices.iter_all(page_size=0):
+                pass
+
+
+async def test_closing_iter_all_cancels_the_prefetch(make_async_client):
+    prefetch_cancelled = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        if offset > 0:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                prefetch_cancelled.set()
+                raise
+        return httpx.Response(200, json={"events": [event_data(), event_data()]})
+
+    async with make_async_client(handler) as client:
+        events = client.events.iter_all(page_size=2)
+        await events.__anext__()
+        await asyncio.sleep(0)
+        await events.aclose()
+
+        # Cancellation is delivered on the next loop iteration, without
+        # waiting for the abandoned paginator to be garbage collected
+        await asyncio.sleep(0)
+        assert prefetch_cancelled.is_set()
+
+
+async def test_retries_then_raises(make_async_client, sleeps):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(404 if len(requests) > 1 else 503)
+
+    async with make_async_client(handler) as client:
+        with pytest.raises(NotFoundError):
+            await client.events.get("evt-1")
+
+    assert len(requests) == 2
+    assert len(sleeps) == 1
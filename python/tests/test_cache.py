@@ -0,0 +1,78 @@
+"""Tests for GET response caching and ETag revalidation."""
+
+from __future__ import annotations
+
+import httpx
+
+from meshlogic import MemoryCache, MeshLogicClient
+
+from .conftest import BASE_URL
+
+STATUS = {"online": 3, "offline": 1}
+
+
+def status_server(cache_control: str):
+    """Serve fleet status with an ETag, answering matching revalidations with 304."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        headers = {"ETag": '"v1"', "Cache-Control": cache_control}
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, json=STATUS, headers=headers)
+
+    handler.requests = requests  # type: ignore[attr-defined]
+    return handler
+
+
+def test_fresh_response_is_served_from_cache(make_client):
+    handler = status_server("max-age=60")
+    client = make_client(handler, cache=MemoryCache())
+
+    assert client.devices.status() == STATUS
+    assert client.devices.status() == STATUS
+    assert len(handler.requests) == 1
+
+
+def test_stale_response_is_revalidated_with_etag(make_client):
+    handler = status_server("no-cache")
+    client = make_client(handler, cache=MemoryCache())
+
+    assert client.devices.status() == STATUS
+    assert client.devices.status() == STATUS
+
+    first, second = handler.requests
+    assert "If-None-Match" not in first.headers
+    assert second.headers["If-None-Match"] == '"v1"'
+
+
+def test_no_store_response_is_not_cached(make_client):
+    handler = status_server("no-store")
+    client = make_client(handler, cache=MemoryCache())
+
+    client.devices.status()
+    client.devices.status()
+
+    assert all("If-None-Match" not in r.headers for r in handler.requests)
+
+
+def test_shared_cache_is_scoped_per_credential(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        tenant = request.headers["Authorization"].rsplit(" ", 1)[-1]
+        return httpx.Response(200, json={"tenant": tenant}, headers={"Cache-Control": "max-age=60"})
+
+    monkeypatch.setattr(
+        "meshlogic.client._build_http",
+        lambda api_key, base_url, timeout, http2: httpx.Client(
+            base_url=base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            transport=httpx.MockTransport(handler),
+        ),
+    )
+    cache = MemoryCache()
+    tenant_a = MeshLogicClient(api_key="key-a", base_url=BASE_URL, cache=cache)
+    tenant_b = MeshLogicClient(api_key="key-b", base_url=BASE_URL, cache=cache)
+
+    assert tenant_a.devices.status() == {"tenant": "key-a"}
+    assert tenant_b.devices.status() == {"tenant": "key-b"}
@@ -0,0 +1,110 @@
+"""Tests for the short-lived pattern and device catalog cache."""
+
+from __future__ import annotations
+
+import httpx
+
+from .test_decoding import DEVICE, PATTERN
+
+
+def catalog_server():
+    """Serve patterns and devices, recording each request path."""
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/v1/patterns":
+            return httpx.Response(200, json={"patterns": [PATTERN]})
+        if request.url.path == "/v1/devices":
+            return httpx.Response(200, json={"devices": [DEVICE]})
+        return httpx.Response(200, json=DEVICE)
+
+    handler.paths = paths  # type: ignore[attr-defined]
+    return handler
+
+
+def test_pattern_listing_is_reused(make_client):
+    handler = catalog_server()
+    client = make_client(handler)
+
+    assert client.patterns.list() == client.patterns.list()
+    assert handler.paths == ["/v1/patterns"]
+
+
+def test_pattern_listing_is_keyed_by_filters(make_client):
+    handler = catalog_server()
+    client = make_client(handler)
+
+    client.patterns.list()
+    client.patterns.list(category="execution")
+
+    assert len(handler.paths) == 2
+
+
+def test_invalidate_forces_a_refetch(make_client):
+    handler = catalog_server()
+    client = make_client(handler)
+
+    client.patterns.list()
+    client.patterns.invalidate()
+    client.patterns.list()
+
+    assert len(handler.paths) == 2
+
+
+def test_catalog_ttl_zero_disables_caching(make_client):
+    handler = catalog_server()
+    client = make_client(handler, catalog_ttl=0)
+
+    client.patterns.list()
+    client.patterns.list()
+
+    assert len(handler.paths) == 2
+
+
+def test_mutating_a_returned_pattern_leaves_the_cache_intact(make_client):
+    client = make_client(catalog_server())
+
+    client.patterns.list()[0].name = "changed"
+
+    assert client.patterns.list()[0].name == PATTERN["name"]
+
+
+def test_devices_are_not_cached_by_default(make_client):
+    handler = catalog_server()
+    client = make_client(handler)
+
+    client.devices.list()
+    client.devices.list()
+    client.devices.get("dev-1")
+    client.devices.get("dev-1")
+
+    assert handler.paths == ["/v1/devices", "/v1/devices", "/v1/devices/dev-1", "/v1/devices/dev-1"]
+
+
+def test_device_caching_is_opt_in(make_client):
+    handler = catalog_server()
+    client = make_client(handler, device_cache_ttl=30)
+
+    client.devices.get("dev-1").status = "offline"
+    client.devices.list()[0].status = "offline"
+
+    assert client.devices.get("dev-1").status == "online"
+    assert client.devices.list()[0].status == "online"
+    assert handler.paths == ["/v1/devices/dev-1", "/v1/devices"]
+
+    client.devices.invalidate()
+    client.devices.get("dev-1")
+    assert len(handler.paths) == 3
+
+
+async def test_async_pattern_listing_is_reused_and_copied(make_async_client):
+    handler = catalog_server()
+    async with make_async_client(handler) as client:
+        (await client.patterns.list())[0].name = "changed"
+
+        assert (await client.patterns.list())[0].name == PATTERN["name"]
+        await client.devices.list()
+        await client.devices.list()
+
+    assert handler.paths == ["/v1/patterns", "/v1/devices", "/v1/devices"]
@@ -0,0 +1,62 @@
+"""Tests for the shared HTTP connection pools."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from meshlogic import MeshLogicClient
+from meshlogic import client as client_module
+
+from .conftest import BASE_URL, event_data
+
+
+@pytest.fixture(autouse=True)
+def pools(monkeypatch: pytest.MonkeyPatch):
+    """Give each test an empty pool registry answered by a mock transport."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=event_data()))
+
+    class MockClient(httpx.Client):
+        def __init__(self, **kwargs):
+            kwargs.pop("http2", None)
+            super().__init__(transport=transport, **kwargs)
+
+    registry: dict = {}
+    monkeypatch.setattr(client_module, "_shared_http", registry)
+    monkeypatch.setattr(client_module.httpx, "Client", MockClient)
+    return registry
+
+
+def test_clients_with_same_settings_share_a_pool(pools):
+    first = MeshLogicClient(api_key="key-a", base_url=BASE_URL)
+    second = MeshLogicClient(api_key="key-a", base_url=BASE_URL)
+    other_key = MeshLogicClient(api_key="key-b", base_url=BASE_URL)
+    other_timeout = MeshLogicClient(api_key="key-a", base_url=BASE_URL, timeout=5.0)
+
+    assert first._http is second._http
+    assert first._http is not other_key._http
+    assert first._http is not other_timeout._http
+    assert len(pools) == 3
+
+
+def test_close_leaves_the_shared_pool_open():
+    first = MeshLogicClient(api_key="key-a", base_url=BASE_URL)
+    second = MeshLogicClient(api_key="key-a", base_url=BASE_URL)
+
+    first.close()
+
+    assert not second._http.is_closed
+    assert second.events.get("evt-1").id == "evt-1"
+
+
+def test_clients_reopen_a_pool_after_shutdown_all():
+    client = MeshLogicClient(api_key="key-a", base_url=BASE_URL)
+    old_pool = client._http
+
+    MeshLogicClient.shutdown_all()
+    assert old_pool.is_closed
+
+    assert client.events.get("evt-1").id == "evt-1"
+    assert client._http is not old_pool
+    assert not client._http.is_closed
+    assert MeshLogicClient(api_key="key-a", base_url=BASE_URL)._http is client._http
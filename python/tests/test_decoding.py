@@ -0,0 +1,145 @@
+"""Tests for decoding API responses into SDK types and errors."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from meshlogic import Device, MeshLogicError, Pattern, PatternMatch
+
+DEVICE = {
+    "id": "dev-1",
+    "hostname": "web-1",
+    "platform": "linux",
+    "os_version": "6.8",
+    "agent_version": "1.4.0",
+    "last_seen": "2024-06-01T12:00:00Z",
+    "status": "online",
+    "customer_id": "cust-1",
+}
+PATTERN = {
+    "id": "pat-1",
+    "name": "Reverse shell",
+    "category": "execution",
+    "description": "Shell with a network socket on stdin",
+    "severity": "high",
+}
+MATCH = {
+    "id": "match-1",
+    "pattern_id": "pat-1",
+    "pattern_name": "Reverse shell",
+    "event_id": "evt-1",
+    "device_id": "dev-1",
+    "timestamp": "2024-06-01T12:00:00+00:00",
+    "severity": "high",
+}
+
+
+def serve_json(body):
+    return lambda request: httpx.Response(200, json=body)
+
+
+def test_devices_decode_into_dataclasses(make_client):
+    client = make_client(serve_json({"devices": [DEVICE]}))
+
+    (device,) = client.devices.list()
+
+    assert isinstance(device, Device)
+    assert device.hostname == "web-1"
+    assert device.last_seen == datetime(2024, 6, 1, 12, tzinfo=timezone.utc)
+
+
+def test_device_decodes_single_object(make_client):
+    client = make_client(serve_json(DEVICE))
+
+    assert client.devices.get("dev-1").id == "dev-1"
+
+
+def test_patterns_and_matches_apply_defaults(make_client):
+    client = make_client(serve_json({"patterns": [PATTERN], "matches": [MATCH]}))
+
+    (pattern,) = client.patterns.list()
+    (match,) = client.patterns.matches()
+
+    assert isinstance(pattern, Pattern) and pattern.enabled is True
+    assert isinstance(match, PatternMatch) and match.details == {}
+
+
+def test_nullable_fields_accept_null(make_client):
+    device = {**DEVICE, "os_version": None, "agent_version": None}
+    pattern = {**PATTERN, "description": None, "enabled": None}
+    match = {**MATCH, "details": None}
+    client = make_client(
+        serve_json({"devices": [device], "patterns": [pattern], "matches": [match]})
+    )
+
+    (decoded_device,) = client.devices.list()
+    (decoded_pattern,) = client.patterns.list()
+    (decoded_match,) = client.patterns.matches()
+
+    assert decoded_device.os_version is None and decoded_device.agent_version is None
+    assert decoded_pattern.description is None and decoded_pattern.enabled is None
+    assert decoded_match.details is None
+
+
+def test_empty_body_decodes_as_empty_page(make_client):
+    client = make_client(lambda request: httpx.Response(200))
+
+    assert client.devices.list() == []
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        {**DEVICE, "last_seen": "2024-06-01"},
+        {**DEVICE, "os_version": 6.8},
+        {key: value for key, value in DEVICE.items() if key != "hostname"},
+    ],
+    ids=["date-only", "non-string", "missing-field"],
+)
+def test_invalid_record_raises_meshlogic_error(make_client, record):
+    client = make_client(serve_json({"devices": [DEVICE, record]}))
+
+    with pytest.raises(MeshLogicError) as exc_info:
+        client.devices.list()
+
+    assert exc_info.value.code == "INVALID_RESPONSE"
+    assert "$.devices[1]" in exc_info.value.message
+
+
+def test_malformed_body_raises_meshlogic_error(make_client):
+    client = make_client(lambda request: httpx.Response(200, content=b"<html>"))
+
+    with pytest.raises(MeshLogicError) as exc_info:
+        client.patterns.list()
+
+    assert exc_info.value.code == "INVALID_RESPONSE"
+
+
+def test_non_json_success_body_raises_meshlogic_error(make_client):
+    client = make_client(lambda request: httpx.Response(200, content=b"<html>"))
+
+    with pytest.raises(MeshLogicError) as exc_info:
+        client.events.get("evt-1")
+
+    assert exc_info.value.code == "INVALID_RESPONSE"
+
+
+async def test_async_non_json_success_body_raises_meshlogic_error(make_async_client):
+    async with make_async_client(lambda request: httpx.Response(200, content=b"<html>")) as client:
+        with pytest.raises(MeshLogicError) as exc_info:
+            await client.devices.status()
+
+    assert exc_info.value.code == "INVALID_RESPONSE"
+
+
+def test_non_json_error_body_keeps_status(make_client):
+    client = make_client(lambda request: httpx.Response(500, content=b"<html>"))
+
+    with pytest.raises(MeshLogicError) as exc_info:
+        client.devices.status()
+
+    assert exc_info.value.code == "UNKNOWN"
+    assert exc_info.value.status_code == 500
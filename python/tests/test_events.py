@@ -0,0 +1,134 @@
+"""Tests for the events resource: pagination, batch lookups and export."""
+
+from __future__ import annotations
+
+import io
+import threading
+import time
+
+import httpx
+import pytest
+
+from meshlogic import NotFoundError
+
+from .conftest import event_data
+
+
+def paged_events(total: int, on_request=None):
+    """Serve ``total`` events through offset pagination."""
+    offsets = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        offsets.append(offset)
+        if on_request is not None:
+            on_request(offset)
+        ids = range(offset, min(offset + limit, total))
+        return httpx.Response(200, json={"events": [event_data(f"evt-{i}") for i in ids]})
+
+    handler.offsets = offsets  # type: ignore[attr-defined]
+    return handler
+
+
+def test_iter_all_walks_every_page(make_client):
+    handler = paged_events(5)
+    client = make_client(handler)
+
+    events = list(client.events.iter_all(page_size=2))
+
+    assert [e.id for e in events] == [f"evt-{i}" for i in range(5)]
+    assert handler.offsets == [0, 2, 4]
+
+
+def test_iter_all_stops_after_exact_final_page(make_client):
+    handler = paged_events(4)
+    client = make_client(handler)
+
+    assert len(list(client.events.iter_all(page_size=2))) == 4
+    assert handler.offsets == [0, 2, 4]
+
+
+def test_iter_all_prefetches_next_page(make_client):
+    next_page_requested = threading.Event()
+    handler = paged_events(4, on_request=lambda offset: offset == 2 and next_page_requested.set())
+    client = make_client(handler)
+
+    events = client.events.iter_all(page_size=2)
+    next(events)
+
+    # The second page is requested while the caller still holds the first
+    assert next_page_requested.wait(timeout=5)
+    assert len(list(events)) == 3
+
+
+def test_iter_all_rejects_non_positive_page_size(make_client):
+    handler = paged_events(5)
+    client = make_client(handler)
+
+    with pytest.raises(ValueError):
+        list(client.events.iter_all(page_size=0))
+    assert handler.offsets == []
+
+
+def test_get_many_preserves_order(make_client):
+    ids = [f"evt-{i}" for i in range(8)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        event_id = request.url.path.rsplit("/", 1)[-1]
+        # Earlier IDs answer last, so completion order is reversed
+        time.sleep(0.01 * (len(ids) - ids.index(event_id)))
+        return httpx.Response(200, json=event_data(event_id))
+
+    client = make_client(handler)
+
+    assert [e.id for e in client.events.get_many(ids, concurrency=8)] == ids
+    assert client.events.get_many([]) == []
+
+
+@pytest.mark.parametrize("event_ids", [[], ["evt-1"]])
+def test_get_many_rejects_non_positive_concurrency(make_client, event_ids):
+    client = make_client(lambda request: httpx.Response(200, json=event_data()))
+
+    with pytest.raises(ValueError):
+        client.events.get_many(event_ids, concurrency=0)
+
+
+def export_server(chunks, requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=iter(chunks))
+
+    return handler
+
+
+def test_export_streams_to_file(make_client):
+    requests = []
+    client = make_client(export_server([b"id,type\n", b"evt-1,process\n"], requests))
+    out = io.BytesIO()
+
+    assert client.events.export(format="csv", since="24h", out=out) is None
+
+    assert out.getvalue() == b"id,type\nevt-1,process\n"
+    assert requests[0].url.path == "/v1/events/export"
+    assert dict(requests[0].url.params) == {"format": "csv", "since": "24h"}
+
+
+def test_export_iterator_is_lazy_and_chunked(make_client):
+    requests = []
+    client = make_client(export_server([b"a" * 10, b"b" * 10], requests))
+
+    chunks = client.events.export(format="json", chunk_size=4)
+    assert requests == []
+
+    data = list(chunks)
+    assert len(requests) == 1
+    assert b"".join(data) == b"a" * 10 + b"b" * 10
+    assert max(len(chunk) for chunk in data) <= 4
+
+
+def test_export_raises_api_errors(make_client):
+    client = make_client(lambda request: httpx.Response(404))
+
+    with pytest.raises(NotFoundError):
+        list(client.events.export())
@@ -0,0 +1,143 @@
+"""Tests for retry, backoff and Retry-After handling."""
+
+from __future__ import annotations
+
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from meshlogic import MeshLogicError, RateLimitError
+from meshlogic.client import _BACKOFF_JITTER, _DEFAULT_RETRY_AFTER, _parse_retry_after
+
+from .conftest import event_data
+
+
+def responder(*responses: httpx.Response):
+    """Answer successive requests with ``responses``, recording each request."""
+    queue = list(responses)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return queue.pop(0)
+
+    handler.requests = requests  # type: ignore[attr-defined]
+    return handler
+
+
+def test_retries_gateway_errors_with_exponential_backoff(make_client, sleeps):
+    handler = responder(
+        httpx.Response(502),
+        httpx.Response(503),
+        httpx.Response(504),
+        httpx.Response(200, json=event_data()),
+    )
+    client = make_client(handler)
+
+    event = client.events.get("evt-1")
+
+    assert event.id == "evt-1"
+    assert len(handler.requests) == 4
+    for delay, base in zip(sleeps, [0.5, 1.0, 2.0]):
+        assert base <= delay <= base + _BACKOFF_JITTER
+
+
+def test_raises_once_retries_are_exhausted(make_client, sleeps):
+    handler = responder(*[httpx.Response(503, json={"message": "busy"})] * 3)
+    client = make_client(handler, max_retries=2)
+
+    with pytest.raises(MeshLogicError) as exc_info:
+        client.events.get("evt-1")
+
+    assert exc_info.value.status_code == 503
+    assert len(handler.requests) == 3
+    assert len(sleeps) == 2
+
+
+def test_does_not_retry_unlisted_status(make_client, sleeps):
+    handler = responder(httpx.Response(500))
+    client = make_client(handler)
+
+    with pytest.raises(MeshLogicError):
+        client.events.get("evt-1")
+
+    assert len(handler.requests) == 1
+    assert sleeps == []
+
+
+def test_post_is_only_retried_with_idempotency_key(make_client, sleeps):
+    handler = responder(httpx.Response(503))
+    client = make_client(handler)
+    with pytest.raises(MeshLogicError):
+        client._request("POST", "/v1/exports", json={"format": "csv"})
+    assert len(handler.requests) == 1
+
+    handler = responder(httpx.Response(503), httpx.Response(200, json={"ok": True}))
+    client = make_client(handler)
+    assert client._request("POST", "/v1/exports", json={}, idempotency_key="key-1") == {"ok": True}
+    assert [r.headers["Idempotency-Key"] for r in handler.requests] == ["key-1", "key-1"]
+    assert handler.requests[0].content == handler.requests[1].content
+
+
+def test_rate_limit_honours_retry_after_seconds(make_client, sleeps):
+    handler = responder(
+        httpx.Response(429, headers={"Retry-After": "2"}),
+        httpx.Response(200, json=event_data()),
+    )
+    client = make_client(handler)
+
+    client.events.get("evt-1")
+
+    assert len(sleeps) == 1
+    assert 2.0 <= sleeps[0] <= 2.0 + _BACKOFF_JITTER
+
+
+def test_rate_limit_honours_retry_after_date(make_client, sleeps):
+    retry_at = formatdate(time.time() + 5, usegmt=True)
+    handler = responder(
+        httpx.Response(429, headers={"Retry-After": retry_at}),
+        httpx.Response(200, json=event_data()),
+    )
+    client = make_client(handler)
+
+    client.events.get("evt-1")
+
+    assert len(sleeps) == 1
+    assert 3.0 <= sleeps[0] <= 5.0 + _BACKOFF_JITTER
+
+
+def test_rate_limit_raises_immediately_past_the_cap(make_client, sleeps):
+    handler = responder(httpx.Response(429, headers={"Retry-After": "120"}))
+    client = make_client(handler)
+
+    with pytest.raises(RateLimitError) as exc_info:
+        client.events.get("evt-1")
+
+    assert exc_info.value.retry_after == 120
+    assert len(handler.requests) == 1
+    assert sleeps == []
+
+
+@pytest.mark.parametrize("headers", [{}, {"Retry-After": "soon"}])
+def test_rate_limit_without_retry_after_backs_off(make_client, sleeps, headers):
+    handler = responder(*[httpx.Response(429, headers=headers)] * 4)
+    client = make_client(handler)
+
+    with pytest.raises(RateLimitError) as exc_info:
+        client.events.get("evt-1")
+
+    assert exc_info.value.retry_after == _DEFAULT_RETRY_AFTER
+    assert len(handler.requests) == 4
+    for delay, base in zip(sleeps, [0.5, 1.0, 2.0]):
+        assert base <= delay <= base + _BACKOFF_JITTER
+
+
+def test_parse_retry_after():
+    now = 1_700_000_000.0
+    assert _parse_retry_after("7", now) == 7.0
+    assert _parse_retry_after(formatdate(now + 30, usegmt=True), now) == 30.0
+    assert _parse_retry_after(formatdate(now - 30, usegmt=True), now) == 0.0
+    assert _parse_retry_after("soon", now) is None
+    assert _parse_retry_after(None, now) is None
@@ -0,0 +1,248 @@
+"""Tests for real-time event streaming over WebSocket."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import re
+import socket
+import threading
+import time
+
+import pytest
+from websockets.asyncio.server import serve as async_serve
+from websockets.sync.server import serve
+
+from meshlogic import AsyncMeshLogicClient, MeshLogicClient
+from meshlogic.resources import _decode_frames
+
+from .conftest import event_data
+
+WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+def event_frame(event_id: str) -> str:
+    return json.dumps({"type": "event", "event": event_data(event_id)})
+
+
+def drop(ws) -> None:
+    """Cut the connection without a closing handshake, like a network failure."""
+    ws.socket.shutdown(socket.SHUT_RDWR)
+
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_decode_frames_skips_other_frame_types():
+    frames = [
+        b'{"type": "subscribed", "event": "ok"}',
+        b'{"type": "heartbeat"}',
+        event_frame("evt-1").encode(),
+    ]
+
+    assert [e.id for e in _decode_frames(frames)] == ["evt-1"]
+
+
+def test_decode_frames_keeps_rest_of_batch_when_one_frame_is_malformed():
+    frames = [event_frame("evt-1").encode(), b'{"type": "ev', event_frame("evt-2").encode()]
+
+    assert [e.id for e in _decode_frames(frames)] == ["evt-1", "evt-2"]
+
+
+def test_decode_frames_yields_events_before_a_bad_one():
+    frames = [event_frame("evt-1").encode(), event_frame("evt-2").encode()]
+    frames[1] = frames[1].replace(b'"exec"', b'"teleport"')
+    events = _decode_frames(frames)
+
+    assert next(events).id == "evt-1"
+    with pytest.raises(ValueError):
+        next(events)
+
+
+@pytest.fixture
+def stream_server():
+    """Run a WebSocket server in a thread, returning (port, subscriptions)."""
+    subscriptions = []
+
+    def handler(ws) -> None:
+        subscriptions.append(json.loads(ws.recv()))
+        ws.send("")
+        ws.send(json.dumps({"type": "subscribed", "event": "ok"}))
+        ws.send(event_frame(f"evt-{len(subscriptions)}"))
+        if len(subscriptions) == 1:
+            drop(ws)
+        else:
+            for _ in ws:
+                pass
+
+    with serve(handler, "127.0.0.1", 0) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        yield server.socket.getsockname()[1], subscriptions
+        server.shutdown()
+
+
+def test_stream_reconnects_and_resubscribes(stream_server):
+    port, subscriptions = stream_server
+    client = MeshLogicClient(api_key="test-key", base_url=f"http://127.0.0.1:{port}")
+
+    events = []
+    for event in client.events.stream(event_types=["process"], reconnect_delay=1):
+        events.append(event.id)
+        if len(events) == 2:
+            break
+
+    assert events == ["evt-1", "evt-2"]
+    assert subscriptions == [{"type": "subscribe", "event_types": ["process"]}] * 2
+
+
+def test_stream_raises_when_first_connection_fails():
+    client = MeshLogicClient(api_key="test-key", base_url=f"http://127.0.0.1:{unused_port()}")
+
+    with pytest.raises(ConnectionRefusedError):
+        next(client.events.stream())
+
+
+async def test_async_stream_reconnects_and_resubscribes():
+    subscriptions = []
+
+    async def handler(ws) -> None:
+        subscriptions.append(json.loads(await ws.recv()))
+        await ws.send("")
+        await ws.send(json.dumps({"type": "subscribed", "event": "ok"}))
+        await ws.send(event_frame(f"evt-{len(subscriptions)}"))
+        if len(subscriptions) == 1:
+            ws.transport.abort()
+        else:
+            await ws.wait_closed()
+
+    async with async_serve(handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        client = AsyncMeshLogicClient(api_key="test-key", base_url=f"http://127.0.0.1:{port}")
+
+        events = []
+        stream = client.events.stream(device_ids=["dev-1"])
+        async for event in stream:
+            events.append(event.id)
+            if len(events) == 2:
+                break
+        await stream.aclose()
+        await client.close()
+
+    assert events == ["evt-1", "evt-2"]
+    assert subscriptions == [{"type": "subscribe", "device_ids": ["dev-1"]}] * 2
+
+
+async def test_async_stream_raises_when_first_connection_fails():
+    client = AsyncMeshLogicClient(api_key="test-key", base_url=f"http://127.0.0.1:{unused_port()}")
+
+    with pytest.raises(OSError):
+        async for _ in client.events.stream():
+            pass
+    await client.close()
+
+
+def silent_server(frames_per_connection):
+    """
+    Accept WebSocket connections on a raw socket, send frames, then go silent.
+
+    Pings are never answered, as on a half-open TCP connection.
+    """
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    connections = []
+
+    def serve_connections() -> None:
+        for frames in frames_per_connection:
+            conn, _ = listener.accept()
+            connections.append(conn)
+            request = b""
+            while b"\r\n\r\n" not in request:
+                request += conn.recv(4096)
+            key = re.search(rb"Sec-WebSocket-Key: (\S+)", request, re.I).group(1)
+            accept = base64.b64encode(hashlib.sha1(key + WS_GUID).digest())
+            conn.sendall(
+                b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                b"Connection: Upgrade\r\nSec-WebSocket-Accept: " + accept + b"\r\n\r\n"
+            )
+            for frame in frames:
+                payload = frame.encode()
+                conn.sendall(bytes([0x81, 126]) + len(payload).to_bytes(2, "big") + payload)
+
+    threading.Thread(target=serve_connections, daemon=True).start()
+    return listener, connections
+
+
+def test_stream_reconnects_after_silent_drop(monkeypatch):
+    monkeypatch.setattr("meshlogic.resources._STREAM_PING_INTERVAL", 0.2)
+    monkeypatch.setattr("meshlogic.resources._STREAM_PING_TIMEOUT", 0.1)
+    listener, connections = silent_server([[event_frame("evt-1")], [event_frame("evt-2")]])
+    port = listener.getsockname()[1]
+    client = MeshLogicClient(api_key="test-key", base_url=f"http://127.0.0.1:{port}")
+
+    events = []
+    for event in client.events.stream(reconnect_delay=1):
+        events.append(event.id)
+        if len(events) == 2:
+            break
+
+    assert events == ["evt-1", "evt-2"]
+    assert len(connections) == 2
+    for conn in connections:
+        conn.close()
+    listener.close()
+
+
+@pytest.fixture
+def burst_server():
+    """Run a WebSocket server that sends 50 events as fast as it can."""
+
+    def handler(ws) -> None:
+        ws.recv()
+        for i in range(50):
+            ws.send(event_frame(f"evt-{i}"))
+        for _ in ws:
+            pass
+
+    with serve(handler, "127.0.0.1", 0) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        yield server.socket.getsockname()[1]
+        server.shutdown()
+
+
+def stream_threads():
+    return [t for t in threading.enumerate() if t.name == "meshlogic-event-stream"]
+
+
+def test_slow_consumer_gets_every_event_through_a_bounded_buffer(monkeypatch, burst_server):
+    monkeypatch.setattr("meshlogic.resources._STREAM_QUEUE_SIZE", 2)
+    client = MeshLogicClient(api_key="test-key", base_url=f"http://127.0.0.1:{burst_server}")
+
+    events = []
+    for event in client.events.stream():
+        events.append(event.id)
+        if len(events) == 1:
+            time.sleep(0.2)  # let the buffer fill
+        if len(events) == 50:
+            break
+
+    assert events == [f"evt-{i}" for i in range(50)]
+
+
+def test_closing_a_backed_up_stream_stops_the_reader(monkeypatch, burst_server):
+    monkeypatch.setattr("meshlogic.resources._STREAM_QUEUE_SIZE", 2)
+    client = MeshLogicClient(api_key="test-key", base_url=f"http://127.0.0.1:{burst_server}")
+
+    earlier_threads = set(stream_threads())
+    stream = client.events.stream()
+    next(stream)
+    (reader,) = set(stream_threads()) - earlier_threads
+    time.sleep(0.2)
+    stream.close()
+
+    reader.join(timeout=5)
+    assert not reader.is_alive()